@@ -1,11 +1,37 @@
-from pydantic import BaseModel, Field
-from typing import Dict, List, Optional
-from datetime import datetime
-
-class GazeData(BaseModel):
-    timestamp: datetime
-    x: float = Field(ge=0)
-    y: float = Field(ge=0)
-    confidence: float = Field(ge=0, le=1)
-    pupil_size: Optional[float] = None
-    screen_section: Optional[str] = None
\ No newline at end of file
+from typing import Dict, List, Optional, TypedDict
+
+import numpy as np
+
+class GazeData(TypedDict, total=False):
+    timestamp: int  # milliseconds since epoch
+    x: float
+    y: float
+    confidence: float
+    pupil_size: Optional[float]
+    screen_section: Optional[str]
+
+def _column(records: List[Dict], field: str) -> np.ndarray:
+    values = [record.get(field) for record in records]
+    return np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+
+def validate_gaze_batch(records: List[Dict]) -> List[int]:
+    """Validate a batch of GazeData records in one NumPy pass
+
+    Applies the constraints of the former per-record model (x, y >= 0,
+    0 <= confidence <= 1, timestamp required) and returns the indices of
+    the records that violate them.
+    """
+    if not records:
+        return []
+    try:
+        timestamp, x, y, confidence = (
+            _column(records, field) for field in ("timestamp", "x", "y", "confidence")
+        )
+    except (TypeError, ValueError):
+        # Non-numeric values somewhere in the batch: fall back to checking each record
+        if len(records) == 1:
+            return [0]
+        return [i for i, record in enumerate(records) if validate_gaze_batch([record])]
+    with np.errstate(invalid="ignore"):
+        valid = np.isfinite(timestamp) & (x >= 0) & (y >= 0) & (confidence >= 0) & (confidence <= 1)
+    return np.flatnonzero(~valid).tolist()
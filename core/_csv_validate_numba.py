@@ -0,0 +1,35 @@
+"""Numba-compiled block validation for csv_exporter
+
+Imported by csv_exporter only when numba is installed; the NumPy reference
+implementation with the same contract is csv_exporter._mask_block.
+"""
+import numpy as np
+from numba import njit, prange
+
+
+# Samples are independent, so rows are split across threads with prange.
+# fastmath is deliberately off: it would let LLVM assume no NaN/inf values.
+@njit(parallel=True, cache=True)
+def validate_columns(timestamps, values, lower, upper, past_limit, future_limit):
+    """Validate a block of samples in one compiled pass
+
+    Args:
+        timestamps: Array of millisecond timestamps (NaN when unparseable)
+        values: Float array of shape (fields, samples), cleaned in place
+        lower, upper: float64 arrays with the inclusive range of each field
+        past_limit, future_limit: accepted timestamp window in milliseconds
+
+    Returns:
+        Boolean mask of samples with a valid timestamp. Invalid field values
+        are replaced by NaN.
+    """
+    n = timestamps.shape[0]
+    valid = np.zeros(n, dtype=np.bool_)
+    for i in prange(n):
+        ts = timestamps[i]
+        valid[i] = ts >= past_limit and ts <= future_limit
+        for f in range(values.shape[0]):
+            v = values[f, i]
+            if not (np.isfinite(v) and lower[f] <= v <= upper[f]):
+                values[f, i] = np.nan
+    return valid
@@ -1,8 +1,8 @@
 declare module '@core/csv_exporter' {
     export class CSVExporter {
-        constructor(buffer_size?: number);
+        constructor(buffer_size?: number, use_polars?: boolean);
         
-        generate_test_data(duration_minutes?: number, sampling_rate?: number): Array<{
+        generate_test_data(duration_minutes?: number, sampling_rate?: number, seed?: number, profile?: 'smooth' | 'linear'): Iterable<{
             timestamp: number;
             x: number;
             y: number;
@@ -18,7 +18,7 @@ declare module '@core/csv_exporter' {
             HeadRoll: number;
         }>;
         
-        export_pilot_test_data(duration_minutes?: number): string;
+        export_pilot_test_data(duration_minutes?: number): Buffer;
         
         export_session(session_data: {
             gaze_data: Array<{
@@ -36,6 +36,8 @@ declare module '@core/csv_exporter' {
                 HeadPitch?: number;
                 HeadRoll?: number;
             }>;
-        }): string;
+        }): Buffer;
+        
+        export_session_iter(session_data: { gaze_data: any[] }): Iterable<string>;
     }
 } 
\ No newline at end of file